@@ -8,28 +8,50 @@ that each participant is assigned another participant to whom they can give a gi
 adhering to the rules of not being assigned to themselves or their partners.
 """
 
-import random
+import collections
 import os
 import sys
 
-def is_assignment_possible(participants):
+from santa_core import assign_secret_santa
+
+if os.name == 'nt':
+    os.system('')  # Enable ANSI escape sequence processing in the Windows console
+
+def _clear():
+    """
+    Clear the console screen, including its scrollback, with an ANSI escape sequence.
+    Falls back to the 'cls'/'clear' command when the output is not an ANSI-capable terminal.
+    """
+    if sys.stdout.isatty() and os.environ.get('TERM') != 'dumb':
+        sys.stdout.write('\x1b[2J\x1b[3J\x1b[H')
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+# Batch mode (for scripted input files) is opt-in: stdin not being a TTY doesn't mean
+# nobody is typing, e.g. in Git Bash/mintty or some IDE run windows
+_BATCH_MODE = '--batch' in sys.argv[1:]
+_input_buffer = None
+
+def _input(prompt=''):
     """
-    Check if a valid Secret Santa assignment is possible.
-    A valid assignment is possible if there's at least one participant who
-    can be assigned a Secret Santa without breaking the rules.
+    Read a line of input like input(), but in batch mode (--batch), read all of stdin
+    once up front and serve the lines from a buffer.
 
     Args:
-    participants (dict): Dictionary of participants and their partners.
+    prompt (str): The prompt to display to the user.
 
     Returns:
-    bool: True if an assignment is possible, False otherwise.
+    str: The line read, without the trailing newline.
     """
-    for santa in participants:
-        possible_recipients = [name for name in participants if name != santa and name != participants[santa]]
-        if not possible_recipients:
-            return False
-    return True
-
+    global _input_buffer
+    if _input_buffer is None and _BATCH_MODE:
+        _input_buffer = collections.deque(sys.stdin.read().splitlines())
+    if _input_buffer:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        return _input_buffer.popleft()
+    return input(prompt)
 
 def input_participants():
     """
@@ -40,6 +62,7 @@ def input_participants():
            and the other for pre-determined assignments.
     """
     participants = {}
+    entries = []  # (name, partner) tuples in the order they were entered
     displayed_pairs = set()  # Set to keep track of displayed pairs
     pre_assigned = {}  # Dictionary to store pre-determined assignments
     in_pre_assignment = False  # Flag to track if we are in pre-assignment mode
@@ -47,10 +70,11 @@ def input_participants():
     while True:
         print("\nEnter the names of participants. Type 'done' when finished.")
         participants.clear()
+        entries.clear()
         displayed_pairs.clear()
 
         while True:
-            name = input("Enter participant's name: ").strip()
+            name = _input("Enter participant's name: ").strip()
             if not name:
                 print("Please enter a valid name.")
                 continue
@@ -64,7 +88,7 @@ def input_participants():
                     in_pre_assignment = True
                     print("Enter pre-determined assignments (format: Giver > Receiver). Type '1' to finish.")
                     while True:
-                        assignment = input().strip()
+                        assignment = _input().strip()
                         if assignment == '1':
                             break
                         if '>' in assignment:
@@ -73,72 +97,41 @@ def input_participants():
                                 pre_assigned[giver.strip()] = receiver.strip()
                             except ValueError:
                                 print("Invalid format for assignment. Please use 'Giver > Receiver'.")
-                        os.system('cls' if os.name == 'nt' else 'clear')
+                        _clear()
                     continue
 
             if name.lower() == 'done':
                 break
-            partner = input(f"Enter {name}'s partner's name (or 'none' if no partner): ").strip()
+            partner = _input(f"Enter {name}'s partner's name (or 'none' if no partner): ").strip()
             partner = None if partner.lower() == 'none' else partner
             if partner == name:
                 print("A participant cannot be their own partner. Please re-enter.")
                 continue
+            entries.append((name, partner))
+
+        # Build the participants in one pass, then add partners who weren't entered themselves
+        for name, partner in entries:
             participants[name] = partner
+        for name, partner in entries:
             if partner and partner not in participants:
                 participants[partner] = name  # Add partner as a participant as well
-            
+
         print("\nParticipants and their partners:")
         for participant, partner in participants.items():
-            if partner and (participant, partner) not in displayed_pairs and (partner, participant) not in displayed_pairs:
-                print(f"{participant} - {partner}")
-                displayed_pairs.add((participant, partner))  # Mark this pair as displayed
-            elif not partner:
+            if partner:
+                pair = frozenset((participant, partner))  # Unordered, so both directions share one key
+                if pair not in displayed_pairs:
+                    print(f"{participant} - {partner}")
+                    displayed_pairs.add(pair)  # Mark this pair as displayed
+            else:
                 print(f"{participant} - None")
 
-        confirm = input("\nIs the above information correct? (yes/no): ").strip().lower()
+        confirm = _input("\nIs the above information correct? (yes/no): ").strip().lower()
         if confirm == 'yes':
             break
 
     return participants, pre_assigned
 
-def assign_secret_santa(participants, pre_assigned):
-    """
-    Assign each participant a Secret Santa, considering pre-determined assignments.
-
-    Args:
-    participants (dict): Dictionary of participants and their partners.
-    pre_assigned (dict): Dictionary of pre-determined Santa assignments.
-
-    Returns:
-    dict: A dictionary of assigned Santas or None if an assignment is not possible.
-    """
-    all_names = list(participants.keys())
-    valid_assignments = {name: [n for n in all_names if n != name and n != participants[name]] for name in all_names}
-
-    assignments = pre_assigned.copy()  # Start with pre-assigned participants
-    all_names = [name for name in all_names if name not in pre_assigned]  # Exclude pre-assigned givers
-
-    while all_names:
-        santa = random.choice(all_names)
-        possible_recipients = valid_assignments[santa]
-
-        # Exclude already assigned giftees
-        possible_recipients = [recipient for recipient in possible_recipients if recipient not in assignments.values()]
-        
-        if not possible_recipients:
-            return None  # Restart the process if stuck
-
-        giftee = random.choice(possible_recipients)
-        assignments[santa] = giftee
-        all_names.remove(santa)
-
-        # Remove giftee from other's possible recipients
-        for name in valid_assignments:
-            if giftee in valid_assignments[name]:
-                valid_assignments[name].remove(giftee)
-
-    return assignments
-
 def reveal_assignments(assignment):
     """
     Reveal the Secret Santa assignments to participants in a 'secret' way.
@@ -147,17 +140,23 @@ def reveal_assignments(assignment):
     assignment (dict): Dictionary containing the Secret Santa assignments.
     """
     print("\nDo you want to see the assignments? (yes/no): ")
-    if input().strip().lower() != 'yes':
+    if _input().strip().lower() != 'yes':
         print("Exiting program.")
         sys.exit()
 
-    for santa in assignment:
-        input(f"\n{santa}: (Press Enter to reveal)")
-        print(f"-> {assignment[santa]}")
-        input("Press Enter to continue...")
+    for santa, giftee in list(assignment.items()):
+        _input(f"\n{santa}: (Press Enter to reveal)")
+        # Write the reveal and the next prompt together, flushing once
+        sys.stdout.write(f"-> {giftee}\nPress Enter to continue...")
+        sys.stdout.flush()
+        _input()
 
         # Clear the console screen to hide the previous assignment
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear()
+
+# Accepted answers, built once instead of on every call
+_YES_RESPONSES = frozenset(('yes', 'y'))
+_NO_RESPONSES = frozenset(('no', 'n'))
 
 def get_yes_or_no_input(prompt):
     """
@@ -170,10 +169,10 @@ def get_yes_or_no_input(prompt):
     bool: True if the user inputs 'yes' or 'y', False otherwise.
     """
     while True:
-        response = input(prompt).strip().lower()
-        if response in ['yes', 'y']:
+        response = _input(prompt).strip().lower()
+        if response in _YES_RESPONSES:
             return True
-        elif response in ['no', 'n']:
+        elif response in _NO_RESPONSES:
             return False
         else:
             print("Invalid response. Please answer with 'yes', 'no', 'y', or 'n'.")
@@ -190,30 +189,28 @@ def check_assignments_again(assignment):
             print("Exiting program.")
             break
 
-        santa = input("Enter your name to see your Secret Santa assignment: ").strip()
+        santa = _input("Enter your name to see your Secret Santa assignment: ").strip()
         if santa in assignment:
             print(f"Your Secret Santa assignment is: {assignment[santa]}")
-            input("Press Enter to continue...")
-            os.system('cls' if os.name == 'nt' else 'clear')
+            _input("Press Enter to continue...")
+            _clear()
         else:
             print("Name not found. Please try again.")
-            input("Press Enter to continue...")
-            os.system('cls' if os.name == 'nt' else 'clear')
+            _input("Press Enter to continue...")
+            _clear()
 
 
 # Main Program
 participants, pre_assigned = input_participants()
+assignment = assign_secret_santa(participants, pre_assigned)
 
-while not is_assignment_possible(participants):
+while assignment is None:
     print("\nAssignment is not possible with the current set of participants.")
-    choice = input("Do you want to re-enter participant information? (yes/no): ").strip().lower()
+    choice = _input("Do you want to re-enter participant information? (yes/no): ").strip().lower()
     if choice != 'yes':
         print("Exiting program.")
         exit(0)
-    participants = input_participants()
-
-assignment = None
-while not assignment:
+    participants, pre_assigned = input_participants()
     assignment = assign_secret_santa(participants, pre_assigned)
 
 reveal_assignments(assignment)
@@ -0,0 +1,228 @@
+"""
+Secret Santa Assignment Core
+
+This module contains the assignment solver used by main.py. It is kept separate from 
+the interactive script so that Python caches its compiled bytecode in __pycache__ 
+and later runs can load it directly instead of recompiling the solver each time.
+"""
+
+import functools
+import random
+
+def _hopcroft_karp(givers, neighbors, offsets):
+    """
+    Find a maximum matching in a bipartite graph using the Hopcroft-Karp algorithm.
+
+    The graph is stored in CSR form: the receivers giver u may be matched with are
+    neighbors[offsets[u]:offsets[u + 1]].
+
+    Args:
+    givers (list): Giver indices, in the order they should be matched.
+    neighbors (list): Receiver indices of all givers' candidate lists, concatenated.
+    offsets (list): Start of each participant's candidate list in neighbors, plus the end of the last one.
+
+    Returns:
+    dict: A dictionary mapping matched giver indices to their receiver indices.
+    """
+    # All state lives in flat int lists; index n is a dummy vertex standing for "unmatched"
+    n = len(offsets) - 1
+    NIL = n
+    INF = n + 1
+    pair_u = [NIL] * n
+    pair_v = [NIL] * n
+    dist = [INF] * (n + 1)
+
+    def bfs():
+        # Layer the graph starting from all free givers
+        queue = []
+        for u in givers:
+            if pair_u[u] == NIL:
+                dist[u] = 0
+                queue.append(u)
+            else:
+                dist[u] = INF
+        dist[NIL] = INF
+        for u in queue:
+            if dist[u] < dist[NIL]:
+                for k in range(offsets[u], offsets[u + 1]):
+                    w = pair_v[neighbors[k]]
+                    if dist[w] == INF:
+                        dist[w] = dist[u] + 1
+                        if w != NIL:
+                            queue.append(w)
+        return dist[NIL] != INF
+
+    def dfs(root):
+        # Follow the layers to find an augmenting path ending in a free receiver.
+        # Iterative, with an explicit stack of (giver, next edge position) frames.
+        stack = [(root, offsets[root])]
+        while stack:
+            u, k = stack[-1]
+            if k == offsets[u + 1]:
+                dist[u] = INF  # Dead end, don't visit this giver again in this phase
+                stack.pop()
+                continue
+            stack[-1] = (u, k + 1)
+            w = pair_v[neighbors[k]]
+            if dist[w] == dist[u] + 1:
+                if w == NIL:
+                    # Flip the matching along the edge each frame last followed
+                    for x, j in stack:
+                        y = neighbors[j - 1]
+                        pair_u[x] = y
+                        pair_v[y] = x
+                    return True
+                stack.append((w, offsets[w]))
+        return False
+
+    # Seed with a greedy matching; pair_v doubles as the set of used receivers,
+    # so the candidate lists never need to be modified
+    for u in givers:
+        for k in range(offsets[u], offsets[u + 1]):
+            v = neighbors[k]
+            if pair_v[v] == NIL:
+                pair_u[u] = v
+                pair_v[v] = u
+                break
+
+    while bfs():
+        for u in givers:
+            if pair_u[u] == NIL:
+                dfs(u)
+
+    return {u: pair_u[u] for u in givers if pair_u[u] != NIL}
+
+def _candidate_graph(participants, pre_assigned):
+    """
+    Build the bipartite graph of remaining givers and receivers over integer indices.
+
+    Args:
+    participants (dict): Dictionary of participants and their partners.
+    pre_assigned (dict): Dictionary of pre-determined Santa assignments.
+
+    Returns:
+    tuple: The participant names, the giver indices, each giver's partner index (-1 if none)
+           and the indices of receivers still free, or None if the bitmask checks already
+           show that no assignment is possible.
+    """
+    names = list(participants.keys())
+    index = {name: i for i, name in enumerate(names)}
+    full_mask = (1 << len(names)) - 1
+
+    # Receivers already taken by pre-assignments, as a set and as a bitmask
+    taken = {index[receiver] for receiver in pre_assigned.values() if receiver in index}
+    used = 0
+    for receiver in taken:
+        used |= 1 << receiver
+
+    givers = [i for i, name in enumerate(names) if name not in pre_assigned]  # Exclude pre-assigned givers
+    partner_of = {}  # Partner index of each giver, or -1 if they have none
+    reachable = 0
+    for giver in givers:
+        forbidden = 1 << giver
+        partner = index.get(participants[names[giver]], -1)
+        if partner >= 0:
+            forbidden |= 1 << partner
+        candidates = full_mask & ~forbidden & ~used
+        if not candidates:
+            return None  # This giver has nobody left to give to
+        partner_of[giver] = partner
+        reachable |= candidates
+
+    # Hall's condition for the whole set of givers: together they must reach enough receivers
+    if bin(reachable).count('1') < len(givers):
+        return None
+
+    receivers = tuple(i for i in range(len(names)) if i not in taken)
+    return tuple(names), tuple(givers), partner_of, receivers
+
+def _candidate_csr(n, partner_of, receivers):
+    """
+    Lay out every giver's candidate receivers as CSR arrays, indexed by participant.
+
+    Args:
+    n (int): Number of participants.
+    partner_of (dict): Partner index of each giver, or -1 if they have none.
+    receivers (tuple): Indices of receivers still free.
+
+    Returns:
+    tuple: The neighbors and offsets lists expected by _hopcroft_karp.
+    """
+    neighbors = []
+    offsets = [0]
+    for i in range(n):
+        if i in partner_of:
+            partner = partner_of[i]
+            row = [j for j in receivers if j != i and j != partner]
+        else:
+            row = []  # Pre-assigned givers have no candidates
+        neighbors.extend(row)
+        offsets.append(len(neighbors))
+    return neighbors, offsets
+
+def assign_secret_santa(participants, pre_assigned, seed=None):
+    """
+    Assign each participant a Secret Santa, considering pre-determined assignments.
+
+    Whether a valid assignment exists at all is decided first by a perfect matching on
+    the bipartite graph of givers and receivers. If it does, random assignments of the
+    remaining givers to the remaining receivers are drawn until one breaks no rule
+    (giving to yourself or your partner), which makes the draw uniform over all valid
+    assignments. Each giver rules out at most two receivers, so a random draw is valid
+    often enough (roughly 1 in e^2 for large groups) that only a few draws are needed.
+
+    Args:
+    participants (dict): Dictionary of participants and their partners.
+    pre_assigned (dict): Dictionary of pre-determined Santa assignments.
+    seed (int, optional): Seed for the draw, to make it reproducible. Defaults to a fresh random seed.
+
+    Returns:
+    dict: A dictionary of assigned Santas or None if an assignment is not possible.
+    """
+    graph = _feasible_graph(frozenset(participants.items()), frozenset(pre_assigned.items()))
+    if graph is None:
+        return None
+    names, givers, partner_of, receivers = graph
+
+    rng = random.Random(seed)  # Own generator, so a seeded draw doesn't touch the global random state
+    while True:
+        drawn = rng.sample(receivers, len(givers))
+        if all(receiver != giver and receiver != partner_of[giver] for giver, receiver in zip(givers, drawn)):
+            break
+
+    assignments = pre_assigned.copy()  # Start with pre-assigned participants
+    assignments.update((names[giver], names[receiver]) for giver, receiver in zip(givers, drawn))
+    return assignments
+
+def is_assignment_possible(participants, pre_assigned):
+    """
+    Check if a valid Secret Santa assignment is possible.
+    By Hall's theorem, a valid assignment exists if and only if the bipartite graph
+    of remaining givers and receivers has a perfect matching.
+
+    Args:
+    participants (dict): Dictionary of participants and their partners.
+    pre_assigned (dict): Dictionary of pre-determined Santa assignments.
+
+    Returns:
+    bool: True if an assignment is possible, False otherwise.
+    """
+    return _feasible_graph(frozenset(participants.items()), frozenset(pre_assigned.items())) is not None
+
+@functools.lru_cache(maxsize=32)
+def _feasible_graph(participants_signature, pre_assigned_signature):
+    """
+    Cached feasibility check keyed on the canonical (order-independent) form of the input.
+    Returns the graph from _candidate_graph if a valid assignment exists, None otherwise,
+    so a draw can reuse it without building it again. The cached graph is shared between
+    calls and must not be modified.
+    """
+    # Sort the names so indices, and with them seeded draws, don't depend on string hashing
+    graph = _candidate_graph(dict(sorted(participants_signature)), dict(sorted(pre_assigned_signature)))
+    if graph is None:
+        return None
+    names, givers, partner_of, receivers = graph
+    neighbors, offsets = _candidate_csr(len(names), partner_of, receivers)
+    if len(_hopcroft_karp(givers, neighbors, offsets)) < len(givers):
+        return None  # No perfect matching, so no valid assignment exists
+    return graph
@@ -0,0 +1,128 @@
+"""
+Tests for the Secret Santa assignment core.
+
+Run with: python -m unittest test_santa_core
+"""
+
+import collections
+import itertools
+import random
+import unittest
+
+from santa_core import assign_secret_santa, is_assignment_possible
+
+
+def brute_force_assignments(participants, pre_assigned):
+    """
+    List every valid completion of the pre-determined assignments by trying all permutations.
+
+    Args:
+    participants (dict): Dictionary of participants and their partners.
+    pre_assigned (dict): Dictionary of pre-determined Santa assignments.
+
+    Returns:
+    list: All valid assignments, each as a dictionary.
+    """
+    givers = [name for name in participants if name not in pre_assigned]
+    receivers = [name for name in participants if name not in pre_assigned.values()]
+    valid = []
+    for drawn in itertools.permutations(receivers, len(givers)):
+        if all(receiver != giver and receiver != participants[giver] for giver, receiver in zip(givers, drawn)):
+            assignment = pre_assigned.copy()
+            assignment.update(zip(givers, drawn))
+            valid.append(assignment)
+    return valid
+
+
+def random_input(rng):
+    """
+    Build a small random set of participants, with some couples and pre-determined assignments.
+    """
+    names = [f"P{i}" for i in range(rng.randint(1, 7))]
+    participants = {name: None for name in names}
+    for a, b in zip(names[::2], names[1::2]):
+        if rng.random() < 0.5:
+            participants[a], participants[b] = b, a
+    pre_assigned = {}
+    for giver in names:
+        if rng.random() < 0.2:
+            pre_assigned[giver] = rng.choice(names)
+    # Keep the pre-assigned receivers distinct, as the input loop would for sensible data
+    seen = set()
+    for giver, receiver in list(pre_assigned.items()):
+        if receiver in seen:
+            del pre_assigned[giver]
+        seen.add(receiver)
+    return participants, pre_assigned
+
+
+class TestFeasibility(unittest.TestCase):
+    def test_single_couple_is_impossible(self):
+        self.assertFalse(is_assignment_possible({'A': 'B', 'B': 'A'}, {}))
+        self.assertIsNone(assign_secret_santa({'A': 'B', 'B': 'A'}, {}))
+
+    def test_pre_assignment_can_make_it_impossible(self):
+        participants = {'A': None, 'B': None, 'C': None}
+        self.assertTrue(is_assignment_possible(participants, {}))
+        # A gives to B, leaving B -> C and C -> A
+        self.assertTrue(is_assignment_possible(participants, {'A': 'B'}))
+        # A and B give to each other, leaving C nobody but themselves
+        self.assertFalse(is_assignment_possible(participants, {'A': 'B', 'B': 'A'}))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            participants, pre_assigned = random_input(rng)
+            expected = bool(brute_force_assignments(participants, pre_assigned))
+            self.assertEqual(is_assignment_possible(participants, pre_assigned), expected,
+                             (participants, pre_assigned))
+            self.assertEqual(assign_secret_santa(participants, pre_assigned) is not None, expected,
+                             (participants, pre_assigned))
+
+
+class TestAssignment(unittest.TestCase):
+    def test_assignment_is_valid(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            participants, pre_assigned = random_input(rng)
+            assignment = assign_secret_santa(participants, pre_assigned)
+            if assignment is None:
+                continue
+            self.assertIn(assignment, brute_force_assignments(participants, pre_assigned))
+
+    def test_large_group(self):
+        participants = {f"P{i}": f"P{i ^ 1}" for i in range(500)}
+        assignment = assign_secret_santa(participants, {})
+        self.assertEqual(sorted(assignment.values()), sorted(participants))
+        for santa, giftee in assignment.items():
+            self.assertNotIn(giftee, (santa, participants[santa]))
+
+    def test_seed_is_reproducible(self):
+        participants = {name: None for name in 'ABCDEFG'}
+        self.assertEqual(assign_secret_santa(participants, {}, seed=7),
+                         assign_secret_santa(participants, {}, seed=7))
+        # The order the participants were entered in doesn't change a seeded draw
+        reordered = dict(reversed(participants.items()))
+        self.assertEqual(assign_secret_santa(participants, {}, seed=7),
+                         assign_secret_santa(reordered, {}, seed=7))
+
+    def test_draw_is_uniform(self):
+        cases = [
+            ({name: None for name in 'ABCD'}, {}),
+            ({'A': 'B', 'B': 'A', 'C': 'D', 'D': 'C', 'E': None, 'F': None}, {'E': 'A'}),
+        ]
+        for participants, pre_assigned in cases:
+            valid = brute_force_assignments(participants, pre_assigned)
+            draws = 1000 * len(valid)
+            counts = collections.Counter(
+                tuple(sorted(assign_secret_santa(participants, pre_assigned, seed=seed).items()))
+                for seed in range(draws)
+            )
+            self.assertEqual(len(counts), len(valid))
+            # Each count is binomial with mean 1000 and a standard deviation of about 31
+            for count in counts.values():
+                self.assertLess(abs(count - 1000), 150)
+
+
+if __name__ == '__main__':
+    unittest.main()